@@ -1,15 +1,37 @@
+from typing import TYPE_CHECKING
 from .sarv_client import SarvClient
+from .batch import Batch
 from ._url import SarvAPI_v5, SarvURL, SarvFrontend
 from .exceptions import SarvException
 from .modules._base import SarvModule
 from .__version__ import __version__ as version
 
+if TYPE_CHECKING:
+    from .async_sarv_client import AsyncSarvClient
+
 __all__ = [
     'SarvClient',
+    'AsyncSarvClient',
+    'Batch',
     'SarvURL',
     'SarvFrontend',
     'SarvAPI_v5',
     'SarvException',
     'SarvModule',
     'version'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str) -> type:
+    """Import AsyncSarvClient on first access, so sync users do not pay for importing httpx"""
+    if name != 'AsyncSarvClient':
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+    from .async_sarv_client import AsyncSarvClient
+    globals()[name] = AsyncSarvClient
+    return AsyncSarvClient
+
+
+def __dir__() -> list[str]:
+    """Include the lazily imported classes for autocompletion"""
+    return sorted({*globals(), *__all__})
@@ -1,45 +1,69 @@
-from .modules import *
+from typing import TYPE_CHECKING, Any
+from . import modules
+
+if TYPE_CHECKING:
+    from .modules import *
 
 class ModulesMixin:
-    def __init__(self) -> None:
-        """This is abstract module for adding sarv modules to sarvclient class"""
-        self.Accounts = Accounts(self)
-        self.AosContracts = AosContracts(self)
-        self.AosInvoices = AosInvoices(self)
-        self.AosPdfTemplates = AosPdfTemplates(self)
-        self.AosProductCategories = AosProductCategories(self)
-        self.AosProducts = AosProducts(self)
-        self.AosQuotes = AosQuotes(self)
-        self.Appointments = Appointments(self)
-        self.Approval = Approval(self)
-        self.AsolProject = AsolProject(self)
-        self.Branches = Branches(self)
-        self.Bugs = Bugs(self)
-        self.Calls = Calls(self)
-        self.Cases = Cases(self)
-        self.Communications = Communications(self)
-        self.CommunicationsTarget = CommunicationsTarget(self)
-        self.CommunicationsTemplate = CommunicationsTemplate(self)
-        self.Campaigns = Campaigns(self)
-        self.Contacts = Contacts(self)
-        self.Deposits = Deposits(self)
-        self.Documents = Documents(self)
-        self.Emails = Emails(self)
-        self.KnowledgeBase = KnowledgeBase(self)
-        self.KnowledgeBaseCategories = KnowledgeBaseCategories(self)
-        self.Leads = Leads(self)
-        self.Meetings = Meetings(self)
-        self.Notes = Notes(self)
-        self.ObjConditions = ObjConditions(self)
-        self.ObjIndicators = ObjIndicators(self)
-        self.ObjObjectives = ObjObjectives(self)
-        self.Opportunities = Opportunities(self)
-        self.Payments = Payments(self)
-        self.PurchaseOrder = PurchaseOrder(self)
-        self.ScCompetitor = ScCompetitor(self)
-        self.ScContract = ScContract(self)
-        self.ScContractManagement = ScContractManagement(self)
-        self.ServiceCenters = ServiceCenters(self)
-        self.Tasks = Tasks(self)
-        self.Timesheet = Timesheet(self)
-        self.Vendors = Vendors(self)
\ No newline at end of file
+    """
+    This is abstract module for adding sarv modules to sarvclient class.
+
+    Modules are created on first access and cached as attributes of the instance.
+    """
+
+    # Module classes are resolved through the lazy `modules` package, so only the used ones get imported
+    _MODULE_NAMES: frozenset[str] = frozenset(modules.__all__)
+
+    Accounts: 'Accounts'
+    AosContracts: 'AosContracts'
+    AosInvoices: 'AosInvoices'
+    AosPdfTemplates: 'AosPdfTemplates'
+    AosProductCategories: 'AosProductCategories'
+    AosProducts: 'AosProducts'
+    AosQuotes: 'AosQuotes'
+    Appointments: 'Appointments'
+    Approval: 'Approval'
+    AsolProject: 'AsolProject'
+    Branches: 'Branches'
+    Bugs: 'Bugs'
+    Calls: 'Calls'
+    Cases: 'Cases'
+    Communications: 'Communications'
+    CommunicationsTarget: 'CommunicationsTarget'
+    CommunicationsTemplate: 'CommunicationsTemplate'
+    Campaigns: 'Campaigns'
+    Contacts: 'Contacts'
+    Deposits: 'Deposits'
+    Documents: 'Documents'
+    Emails: 'Emails'
+    KnowledgeBase: 'KnowledgeBase'
+    KnowledgeBaseCategories: 'KnowledgeBaseCategories'
+    Leads: 'Leads'
+    Meetings: 'Meetings'
+    Notes: 'Notes'
+    ObjConditions: 'ObjConditions'
+    ObjIndicators: 'ObjIndicators'
+    ObjObjectives: 'ObjObjectives'
+    Opportunities: 'Opportunities'
+    Payments: 'Payments'
+    PurchaseOrder: 'PurchaseOrder'
+    ScCompetitor: 'ScCompetitor'
+    ScContract: 'ScContract'
+    ScContractManagement: 'ScContractManagement'
+    ServiceCenters: 'ServiceCenters'
+    Tasks: 'Tasks'
+    Timesheet: 'Timesheet'
+    Vendors: 'Vendors'
+
+    def __getattr__(self, name: str) -> Any:
+        """Create the requested sarv module on first access and cache it on the instance"""
+        if name not in type(self)._MODULE_NAMES:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+        module = getattr(modules, name)(self)
+        object.__setattr__(self, name, module)
+        return module
+
+    def __dir__(self) -> list[str]:
+        """Include the lazily created modules for autocompletion"""
+        return sorted({*super().__dir__(), *self._MODULE_NAMES})
@@ -0,0 +1,156 @@
+import httpx
+from typing import Optional, Self
+
+from .sarv_client import CACHE_MISS, SarvClient
+from .type_hints import RequestMethod
+
+from .modules._base import SarvModule
+
+
+class AsyncSarvClient(SarvClient):
+    """
+    AsyncSarvClient extends SarvClient with coroutine based requests built on `httpx`.
+    Many CRM calls can be issued concurrently with `asyncio.gather`, using the
+    `a` prefixed methods of the client and its modules (eg. `client.Accounts.aread_record`).
+    """
+
+    __slots__ = ('_aclient',)
+
+    def __init__(self, *args, **kwargs) -> None:
+        """
+        Initialize the AsyncSarvClient.
+
+        Accepts the same arguments as SarvClient.
+        """
+        super().__init__(*args, **kwargs)
+        self._aclient: Optional[httpx.AsyncClient] = None
+
+
+    def _get_aclient(self) -> httpx.AsyncClient:
+        """
+        Return the `httpx.AsyncClient` of the instance, creating it on first use.
+
+        Returns:
+            httpx.AsyncClient: The shared asynchronous http client.
+        """
+        if self._aclient is None:
+            # httpx only retries failed connections, not error responses
+            transport = httpx.AsyncHTTPTransport(verify=True, http2=True, retries=3)
+            self._aclient = httpx.AsyncClient(transport=transport)
+
+        return self._aclient
+
+
+    async def asend_request(
+            self,
+            request_method: RequestMethod,
+            head_parms: Optional[dict] = None,
+            get_parms: Optional[dict] = None,
+            post_parms: Optional[dict] = None,
+            ) -> dict:
+        """
+        Send a request to the Sarv API asynchronously and return the response data.
+
+        Args:
+            request_method (RequestMethod): The HTTP method for the request ('GET', 'POST', etc.).
+            head_parms (dict): The headers for the request.
+            get_parms (dict): The GET parameters for the request.
+            post_parms (dict): The POST parameters for the request.
+
+        Returns:
+            dict: The data parameter from the server response.
+
+        Raises:
+            SarvException: If the server returns an error response.
+            httpx.HTTPStatusError: If the server returns a 5xx server side error.
+        """
+        head_parms, get_parms, post_parms = self._prepare_request(request_method, head_parms, get_parms, post_parms)
+
+        cache_key, cached_data, stale_entry, head_parms = self._cache_lookup(request_method, head_parms, get_parms)
+        if cached_data is not CACHE_MISS:
+            return cached_data
+
+        response: httpx.Response = await self._get_aclient().request(
+            request_method,
+            url = self.api_url,
+            params = get_parms,
+            headers = head_parms,
+            json = post_parms,
+            )
+
+        return self._handle_response(response, cache_key, stale_entry)
+
+
+    async def alogin(self) -> str:
+        """
+        Authenticate the user asynchronously and retrieve an access token.
+
+        Returns:
+            str: The access token for authenticated requests.
+        """
+        data = await self.asend_request(
+            request_method='POST',
+            get_parms=self.create_get_parms('Login'),
+            post_parms=self._create_login_parms(),
+            )
+
+        if data:
+            self.token = data.get('token')
+
+        return self.token
+
+
+    async def asearch_by_number(
+            self,
+            number: str,
+            module: Optional[SarvModule | str] = None
+            ) -> list[dict]:
+        """
+        Search the CRM by phone number asynchronously and retrieve the module item.
+
+        Args:
+            number (str): The phone number to search for.
+            module (Optional[SarvModule | str]): The module to search in.
+
+        Returns:
+            dict: The data related to the phone number if found.
+        """
+        return await self.asend_request(
+            request_method='GET',
+            get_parms=self.create_get_parms('SearchByNumber', sarv_module=module, number=number),
+            )
+
+
+    async def aclose(self) -> None:
+        """
+        Close the underlying asynchronous http client and the pooled connections of the http session.
+
+        A new client is created if the instance is used again.
+        """
+        if self._aclient is not None:
+            await self._aclient.aclose()
+            self._aclient = None
+
+        self.close()
+
+
+    async def __aenter__(self) -> Self:
+        """Basic Async Context Manager for clean code execution"""
+        await self.alogin()
+        return self
+
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        """Basic Async Context Manager for clean code execution"""
+        self.logout()
+        await self.aclose()
+
+
+    def __str__(self) -> str:
+        """
+        Provides a human-readable string representation of the instance.
+
+        Returns:
+            str: A simplified string representation of the instance.
+        """
+        return f'<AsyncSarvClient {self.utype}>'
@@ -0,0 +1,77 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Self
+
+
+class Batch:
+    """
+    Batch collects independent calls of a SarvClient and its modules and executes them concurrently.
+    The calls run on a thread pool and share the pooled http session of the client.
+    """
+
+    def __init__(self, client, max_workers: int = 10) -> None:
+        """
+        Initialize the Batch.
+
+        Args:
+            client (SarvClient): The client that the batched calls belong to.
+            max_workers (int): The maximum number of calls running at the same time.
+        """
+        from sarvcrm_api import SarvClient
+        self.client: SarvClient = client
+        self.max_workers = max_workers
+        self._jobs: list[tuple[Callable, tuple, dict]] = []
+
+
+    def add(self, function: Callable, *args, **kwargs) -> Self:
+        """
+        Add a call to the batch.
+
+        Args:
+            function (Callable): The method to call, eg. `client.Accounts.read_record`.
+            *args: Positional arguments of the call.
+            **kwargs: Keyword arguments of the call.
+
+        Returns:
+            Batch: The instance itself for chaining.
+        """
+        self._jobs.append((function, args, kwargs))
+        return self
+
+
+    def execute(self) -> list[Any]:
+        """
+        Execute the added calls concurrently and clear the batch.
+
+        Returns:
+            list: The results of the calls, in the same order they were added.
+
+        Raises:
+            Exception: The first exception raised by a call, in the order they were added.
+        """
+        jobs, self._jobs = self._jobs, []
+        if not jobs:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(jobs))) as executor:
+            futures = [executor.submit(function, *args, **kwargs) for function, args, kwargs in jobs]
+            return [future.result() for future in futures]
+
+
+    def __len__(self) -> int:
+        """
+        Returns the number of calls waiting to be executed.
+
+        Returns:
+            int: Number of the added calls.
+        """
+        return len(self._jobs)
+
+
+    def __repr__(self) -> str:
+        """
+        Provides a string representation for debugging purposes.
+
+        Returns:
+            str: A string containing the class name and key attributes.
+        """
+        return f'{self.__class__.__name__}(client={self.client!r}, max_workers={self.max_workers})'
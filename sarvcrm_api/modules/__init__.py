@@ -1,43 +1,91 @@
-from .accounts import Accounts
-from .aos_contracts import AosContracts
-from .aos_invoices import AosInvoices
-from .aos_pdf_templates import AosPdfTemplates
-from .aos_product_categories import AosProductCategories      
-from .aos_products import AosProducts
-from .aos_quotes import AosQuotes
-from .appointments import Appointments
-from .approval import Approval
-from .asol_project import AsolProject
-from .branches import Branches
-from .bugs import Bugs
-from .calls import Calls
-from .cases import Cases
-from .communications import Communications
-from .communications_target import CommunicationsTarget       
-from .communications_template import CommunicationsTemplate   
-from .campaigns import Campaigns
-from .contacts import Contacts
-from .deposits import Deposits
-from .documents import Documents
-from .emails import Emails
-from .knowledge_base import KnowledgeBase
-from .knowledge_base_categories import KnowledgeBaseCategories
-from .leads import Leads
-from .meetings import Meetings
-from .notes import Notes
-from .obj_conditions import ObjConditions
-from .obj_indicators import ObjIndicators
-from .obj_objectives import ObjObjectives
-from .opportunities import Opportunities
-from .payments import Payments
-from .purchase_order import PurchaseOrder
-from .sc_competitor import ScCompetitor
-from .sc_contract import ScContract
-from .sc_contract_management import ScContractManagement
-from .service_centers import ServiceCenters
-from .tasks import Tasks
-from .timesheet import Timesheet
-from .vendors import Vendors
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .accounts import Accounts
+    from .aos_contracts import AosContracts
+    from .aos_invoices import AosInvoices
+    from .aos_pdf_templates import AosPdfTemplates
+    from .aos_product_categories import AosProductCategories
+    from .aos_products import AosProducts
+    from .aos_quotes import AosQuotes
+    from .appointments import Appointments
+    from .approval import Approval
+    from .asol_project import AsolProject
+    from .branches import Branches
+    from .bugs import Bugs
+    from .calls import Calls
+    from .cases import Cases
+    from .communications import Communications
+    from .communications_target import CommunicationsTarget
+    from .communications_template import CommunicationsTemplate
+    from .campaigns import Campaigns
+    from .contacts import Contacts
+    from .deposits import Deposits
+    from .documents import Documents
+    from .emails import Emails
+    from .knowledge_base import KnowledgeBase
+    from .knowledge_base_categories import KnowledgeBaseCategories
+    from .leads import Leads
+    from .meetings import Meetings
+    from .notes import Notes
+    from .obj_conditions import ObjConditions
+    from .obj_indicators import ObjIndicators
+    from .obj_objectives import ObjObjectives
+    from .opportunities import Opportunities
+    from .payments import Payments
+    from .purchase_order import PurchaseOrder
+    from .sc_competitor import ScCompetitor
+    from .sc_contract import ScContract
+    from .sc_contract_management import ScContractManagement
+    from .service_centers import ServiceCenters
+    from .tasks import Tasks
+    from .timesheet import Timesheet
+    from .vendors import Vendors
+
+# Classes are imported on first access, see __getattr__
+_MODULE_PATHS: dict[str, str] = {
+    'Accounts': '.accounts',
+    'AosContracts': '.aos_contracts',
+    'AosInvoices': '.aos_invoices',
+    'AosPdfTemplates': '.aos_pdf_templates',
+    'AosProductCategories': '.aos_product_categories',
+    'AosProducts': '.aos_products',
+    'AosQuotes': '.aos_quotes',
+    'Appointments': '.appointments',
+    'Approval': '.approval',
+    'AsolProject': '.asol_project',
+    'Branches': '.branches',
+    'Bugs': '.bugs',
+    'Calls': '.calls',
+    'Cases': '.cases',
+    'Communications': '.communications',
+    'CommunicationsTarget': '.communications_target',
+    'CommunicationsTemplate': '.communications_template',
+    'Campaigns': '.campaigns',
+    'Contacts': '.contacts',
+    'Deposits': '.deposits',
+    'Documents': '.documents',
+    'Emails': '.emails',
+    'KnowledgeBase': '.knowledge_base',
+    'KnowledgeBaseCategories': '.knowledge_base_categories',
+    'Leads': '.leads',
+    'Meetings': '.meetings',
+    'Notes': '.notes',
+    'ObjConditions': '.obj_conditions',
+    'ObjIndicators': '.obj_indicators',
+    'ObjObjectives': '.obj_objectives',
+    'Opportunities': '.opportunities',
+    'Payments': '.payments',
+    'PurchaseOrder': '.purchase_order',
+    'ScCompetitor': '.sc_competitor',
+    'ScContract': '.sc_contract',
+    'ScContractManagement': '.sc_contract_management',
+    'ServiceCenters': '.service_centers',
+    'Tasks': '.tasks',
+    'Timesheet': '.timesheet',
+    'Vendors': '.vendors',
+}
 
 __all__ = [
     'Accounts',
@@ -80,4 +128,20 @@ __all__ = [
     'Tasks',
     'Timesheet',
     'Vendors',
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str) -> type:
+    """Import the requested sarv module class on first access and cache it in the package"""
+    path = _MODULE_PATHS.get(name)
+    if path is None:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+    module_class = getattr(importlib.import_module(path, __name__), name)
+    globals()[name] = module_class
+    return module_class
+
+
+def __dir__() -> list[str]:
+    """Include the lazily imported classes for autocompletion"""
+    return sorted({*globals(), *__all__})
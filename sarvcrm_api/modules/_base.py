@@ -1,4 +1,5 @@
-from typing import Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterator, Optional
 from sarvcrm_api.type_hints import SarvGetMethods
 
 BASE_LIMIT = 300
@@ -16,6 +17,8 @@ class SarvModule:
         _client (SarvClient): The client instance used to send requests to the Sarv CRM API.
     """
 
+    __slots__ = ('_client', '_get_parms_cache')
+
     _module_name: str = ''
     _label_en: str = 'BASE_CLASS'
     _label_pr: str = 'کلاس اصلی'
@@ -30,6 +33,12 @@ class SarvModule:
         from sarvcrm_api import SarvClient
         self._client: SarvClient = _client
 
+        # Base GET parameters never change for a module, they are copied on use
+        self._get_parms_cache: dict[str, dict] = {
+            method: {'method': method, 'module': self._module_name}
+            for method in ('Save', 'Retrieve', 'GetModuleFields', 'GetRelationship', 'SaveRelationships')
+        }
+
     def create_get_parms(self, sarv_get_method: SarvGetMethods, **addition) -> dict:
         """
         Constructs the parameters for a 'GET' request based on the provided method and additional parameters.
@@ -41,7 +50,42 @@ class SarvModule:
         Returns:
             dict: The parameters to be used in the GET request.
         """
-        return self._client.create_get_parms(sarv_get_method, self, **addition)
+        base = self._get_parms_cache.get(sarv_get_method)
+        get_parms = base.copy() if base is not None else {'method': sarv_get_method, 'module': self._module_name}
+
+        if addition:
+            get_parms.update(addition)
+
+        return get_parms
+
+    def _create_list_parms(
+        self,
+        query: Optional[str] = None,
+        order_by: Optional[str] = None,
+        select_fields: Optional[list[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+    ) -> dict:
+        """
+        Constructs the POST parameters of the list requests, skipping the ones that are not provided.
+
+        Args:
+            query (str, optional): A query to filter the results.
+            order_by (str, optional): A field to order the results by.
+            select_fields (list[str], optional): A list of fields to include in the response.
+            limit (int, optional): The maximum number of items to retrieve.
+            offset (int, optional): The number of items to skip before starting to return results.
+
+        Returns:
+            dict: The parameters to be used in the POST request.
+        """
+        post_parms = {}
+        if query is not None: post_parms['query'] = query
+        if order_by is not None: post_parms['order_by'] = order_by
+        if select_fields is not None: post_parms['select_fields'] = select_fields
+        if limit is not None: post_parms['limit'] = limit
+        if offset is not None: post_parms['offset'] = offset
+        return post_parms
 
     def create(self, **fields_data) -> str:
         """
@@ -80,20 +124,38 @@ class SarvModule:
         Returns:
             list: A list of items from the module.
         """
-        post_parms = {
-            'query': query,
-            'order_by': order_by,
-            'select_fields': select_fields,
-            'limit': limit,
-            'offset': offset
-        }
+        return self._client.send_request(
+            request_method='POST',
+            get_parms=self.create_get_parms('Retrieve'),
+            post_parms=self._create_list_parms(query, order_by, select_fields, limit, offset),
+        )
 
-        post_parms = {k: v for k, v in post_parms.items() if v is not None}
+    def read_list_iter(
+        self,
+        query: Optional[str] = None,
+        order_by: Optional[str] = None,
+        select_fields: Optional[list[str]] = None,
+        limit: int = BASE_LIMIT,
+        offset: int = BASE_OFFSET,
+    ) -> Iterator[dict]:
+        """
+        Streams a list of items from the module, keeping only one item in memory at a time.
+        Useful for large limits, requires the optional `ijson` package.
 
-        return self._client.send_request(
+        Args:
+            query (str, optional): A query to filter the results.
+            order_by (str, optional): A field to order the results by.
+            select_fields (list[str], optional): A list of fields to include in the response.
+            limit (int): The maximum number of items to retrieve.
+            offset (int): The number of items to skip before starting to return results.
+
+        Yields:
+            dict: Each item from the module.
+        """
+        return self._client.send_request_stream(
             request_method='POST',
             get_parms=self.create_get_parms('Retrieve'),
-            post_parms=post_parms,
+            post_parms=self._create_list_parms(query, order_by, select_fields, limit, offset),
         )
 
     def read_list_all(
@@ -131,6 +193,38 @@ class SarvModule:
         
         return all_list
 
+    def iter_pages(
+        self,
+        query: Optional[str] = None,
+        order_by: Optional[str] = None,
+        select_fields: Optional[list[str]] = None,
+        page_size: int = BASE_LIMIT,
+    ) -> Iterator[dict]:
+        """
+        Iterates over all items of the module page by page, optionally filtered by the specified parameters.
+        The next page is fetched in a background thread while the current one is consumed.
+
+        Args:
+            query (str, optional): A query to filter the results.
+            order_by (str, optional): A field to order the results by.
+            select_fields (list[str], optional): A list of fields to include in the response.
+            page_size (int): Number of items to query each iteration from sarv server.
+
+        Yields:
+            dict: Each item from the module.
+        """
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            offset = 0
+            future = executor.submit(self.read_list, query, order_by, select_fields, page_size, offset)
+            while True:
+                page = future.result()
+                if not page:
+                    break
+
+                offset += page_size
+                future = executor.submit(self.read_list, query, order_by, select_fields, page_size, offset)
+                yield from page
+
     def read_record(self, pk: str) -> dict[str, Any]:
         """
         Retrieves a single item from the module using its unique identifier (ID).
@@ -196,8 +290,8 @@ class SarvModule:
         query: Optional[str] = None,
         order_by: Optional[str] = None,
         select_fields: Optional[list[str]] = None,
-        limit: int = BASE_OFFSET,
-        offset: int = BASE_LIMIT,
+        limit: int = BASE_LIMIT,
+        offset: int = BASE_OFFSET,
     ) -> list:
         """
         Retrieves a list of related items for a specific field in the module.
@@ -213,19 +307,10 @@ class SarvModule:
         Returns:
             list: A list of related items.
         """
-        post_parms = {
-            'query': query,
-            'order_by': order_by,
-            'select_fields': select_fields,
-            'limit': limit,
-            'offset': offset
-        }
-        post_parms = {k: v for k, v in post_parms.items() if v is not None}
-
         return self._client.send_request(
             request_method='POST',
             get_parms=self.create_get_parms('GetRelationship', related_field=related_field),
-            post_parms=post_parms,
+            post_parms=self._create_list_parms(query, order_by, select_fields, limit, offset),
         )
 
     def save_relationships(
@@ -251,6 +336,195 @@ class SarvModule:
             post_parms={'field_name': field_name, 'related_records': related_records},
         )
 
+    async def acreate(self, **fields_data) -> str:
+        """
+        Asynchronous version of `create`, requires an AsyncSarvClient.
+
+        Args:
+            **fields_data: The fields and values to be used in the creation of the item.
+
+        Returns:
+            str: The ID of the newly created item.
+        """
+        return (await self._client.asend_request(
+            request_method='POST',
+            get_parms=self.create_get_parms('Save'),
+            post_parms=fields_data,
+        )).get('id', {})
+
+    async def aread_list(
+        self,
+        query: Optional[str] = None,
+        order_by: Optional[str] = None,
+        select_fields: Optional[list[str]] = None,
+        limit: int = BASE_LIMIT,
+        offset: int = BASE_OFFSET,
+    ) -> list[dict]:
+        """
+        Asynchronous version of `read_list`, requires an AsyncSarvClient.
+
+        Args:
+            query (str, optional): A query to filter the results.
+            order_by (str, optional): A field to order the results by.
+            select_fields (list[str], optional): A list of fields to include in the response.
+            limit (int): The maximum number of items to retrieve.
+            offset (int): The number of items to skip before starting to return results.
+
+        Returns:
+            list: A list of items from the module.
+        """
+        return await self._client.asend_request(
+            request_method='POST',
+            get_parms=self.create_get_parms('Retrieve'),
+            post_parms=self._create_list_parms(query, order_by, select_fields, limit, offset),
+        )
+
+    async def aread_list_all(
+        self,
+        query: Optional[str] = None,
+        order_by: Optional[str] = None,
+        select_fields: Optional[list[str]] = None,
+        item_buffer: int = BASE_LIMIT,
+    ) -> list[dict]:
+        """
+        Asynchronous version of `read_list_all`, requires an AsyncSarvClient.
+
+        Args:
+            query (str, optional): A query to filter the results.
+            order_by (str, optional): A field to order the results by.
+            select_fields (list[str], optional): A list of fields to include in the response.
+            item_buffer (int): Number of items to query each iteration from sarv server.
+
+        Returns:
+            list: A list of all items from the module.
+        """
+        offset = 0
+        all_list = []
+        new = ['']
+        while new:
+            new = await self.aread_list(
+                query=query,
+                order_by=order_by,
+                select_fields=select_fields,
+                limit=item_buffer,
+                offset=offset,
+                )
+            all_list += new
+            offset += item_buffer
+
+        return all_list
+
+    async def aread_record(self, pk: str) -> dict[str, Any]:
+        """
+        Asynchronous version of `read_record`, requires an AsyncSarvClient.
+
+        Args:
+            pk (str): The unique identifier (ID) of the item to retrieve.
+
+        Returns:
+            dict: The data of the retrieved item.
+        """
+        return (await self._client.asend_request(
+            request_method='GET',
+            get_parms=self.create_get_parms('Retrieve', id=pk),
+        ))[0]
+
+    async def aupdate(self, pk: str, **fields_data) -> str:
+        """
+        Asynchronous version of `update`, requires an AsyncSarvClient.
+
+        Args:
+            pk (str): The unique identifier (ID) of the item to update.
+            **fields_data: The fields and values to update in the item.
+
+        Returns:
+            str: The ID of the updated item.
+        """
+        return (await self._client.asend_request(
+            request_method='PUT',
+            get_parms=self.create_get_parms('Save', id=pk),
+            post_parms=fields_data,
+        )).get('id')
+
+    async def adelete(self, pk: str) -> str | None:
+        """
+        Asynchronous version of `delete`, requires an AsyncSarvClient.
+
+        Args:
+            pk (str): The unique identifier (ID) of the item to delete.
+
+        Returns:
+            str | None: The ID of the deleted item or None if no item was deleted.
+        """
+        return (await self._client.asend_request(
+            request_method='DELETE',
+            get_parms=self.create_get_parms('Save', id=pk),
+        )).get('id')
+
+    async def aget_module_fields(self) -> dict[str, dict]:
+        """
+        Asynchronous version of `get_module_fields`, requires an AsyncSarvClient.
+
+        Returns:
+            dict: A dictionary containing all the fields of the module.
+        """
+        return await self._client.asend_request(
+            request_method='GET',
+            get_parms=self.create_get_parms('GetModuleFields'),
+        )
+
+    async def aget_relationships(
+        self,
+        related_field: str,
+        query: Optional[str] = None,
+        order_by: Optional[str] = None,
+        select_fields: Optional[list[str]] = None,
+        limit: int = BASE_LIMIT,
+        offset: int = BASE_OFFSET,
+    ) -> list:
+        """
+        Asynchronous version of `get_relationships`, requires an AsyncSarvClient.
+
+        Args:
+            related_field (str): The related field to fetch relationships for.
+            query (str, optional): A query to filter the results.
+            order_by (str, optional): A field to order the results by.
+            select_fields (list[str], optional): A list of fields to include in the response.
+            limit (int): The maximum number of items to retrieve.
+            offset (int): The number of items to skip before starting to return results.
+
+        Returns:
+            list: A list of related items.
+        """
+        return await self._client.asend_request(
+            request_method='POST',
+            get_parms=self.create_get_parms('GetRelationship', related_field=related_field),
+            post_parms=self._create_list_parms(query, order_by, select_fields, limit, offset),
+        )
+
+    async def asave_relationships(
+        self,
+        pk: str,
+        field_name: str,
+        related_records: list,
+    ) -> list:
+        """
+        Asynchronous version of `save_relationships`, requires an AsyncSarvClient.
+
+        Args:
+            pk (str): The unique identifier (ID) of the item.
+            field_name (str): The name of the field to establish the relationship.
+            related_records (list): A list of related records to associate with the item.
+
+        Returns:
+            list: A list of the related records saved in the relationship.
+        """
+        return await self._client.asend_request(
+            request_method='POST',
+            get_parms=self.create_get_parms('SaveRelationships', id=pk),
+            post_parms={'field_name': field_name, 'related_records': related_records},
+        )
+
     def __repr__(self) -> str:
         """
         Returns a string representation of the SarvModule instance.
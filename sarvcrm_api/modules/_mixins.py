@@ -6,6 +6,8 @@ class UrlMixins:
     """
 
     class EditView:
+        __slots__ = ()
+
         def get_url_edit_view(self, pk: Optional[str] = None) -> str:
             """
             Returns Edit View of the Module or Create View of the Module.
@@ -21,6 +23,8 @@ class UrlMixins:
 
 
     class ListView:
+        __slots__ = ()
+
         def get_url_list_view(self) -> str:
             """
             Returns List View of the Module.
@@ -32,6 +36,8 @@ class UrlMixins:
 
 
     class DetailView:
+        __slots__ = ()
+
         def get_url_detail_view(self, pk: str) -> str:
             """
             Returns the Detail View of the specified record with ID.
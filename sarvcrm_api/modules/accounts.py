@@ -2,6 +2,7 @@ from ._base import SarvModule
 from ._mixins import UrlMixins
 
 class Accounts(SarvModule, UrlMixins.DetailView, UrlMixins.ListView, UrlMixins.EditView):
+    __slots__ = ()
     _module_name = 'Accounts'
     _label_en = 'Accounts'
     _label_pr = 'حساب ها'
\ No newline at end of file
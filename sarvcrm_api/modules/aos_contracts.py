@@ -2,6 +2,7 @@ from ._base import SarvModule
 from ._mixins import UrlMixins
 
 class AosContracts(SarvModule, UrlMixins.DetailView, UrlMixins.ListView, UrlMixins.EditView):
+    __slots__ = ()
     _module_name = 'AOS_Contracts'
     _label_en = 'Sales Contract'
     _label_pr = 'قراردادهای فروش'
\ No newline at end of file
@@ -2,6 +2,7 @@ from ._base import SarvModule
 from ._mixins import UrlMixins
 
 class AosPdfTemplates(SarvModule, UrlMixins.DetailView, UrlMixins.ListView, UrlMixins.EditView):
+    __slots__ = ()
     _module_name = 'AOS_PDF_Templates'
     _label_en = 'PDF Templates'
     _label_pr = 'قالب های PDF'
\ No newline at end of file
@@ -2,6 +2,7 @@ from ._base import SarvModule
 from ._mixins import UrlMixins
 
 class AosProducts(SarvModule, UrlMixins.DetailView, UrlMixins.ListView, UrlMixins.EditView):
+    __slots__ = ()
     _module_name = 'AOS_Products'
     _label_en = 'Products'
     _label_pr = 'محصولات'
\ No newline at end of file
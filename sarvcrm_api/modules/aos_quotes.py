@@ -2,6 +2,7 @@ from ._base import SarvModule
 from ._mixins import UrlMixins
 
 class AosQuotes(SarvModule, UrlMixins.DetailView, UrlMixins.ListView, UrlMixins.EditView):
+    __slots__ = ()
     _module_name = 'AOS_Quotes'
     _label_en = 'Quotes'
     _label_pr = 'پیش فاکتورها'
\ No newline at end of file
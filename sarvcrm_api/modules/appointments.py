@@ -2,6 +2,7 @@ from ._base import SarvModule
 from ._mixins import UrlMixins
 
 class Appointments(SarvModule, UrlMixins.DetailView, UrlMixins.ListView, UrlMixins.EditView):
+    __slots__ = ()
     _module_name = 'Appointments'
     _label_en = 'Appointments'
     _label_pr = 'بازدیدها'
\ No newline at end of file
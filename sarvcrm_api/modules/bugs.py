@@ -2,6 +2,7 @@ from ._base import SarvModule
 from ._mixins import UrlMixins
 
 class Bugs(SarvModule, UrlMixins.DetailView, UrlMixins.ListView, UrlMixins.EditView):
+    __slots__ = ()
     _module_name = 'Bugs'
     _label_en = 'Bug Tracker'
     _label_pr = 'پیگیری ایرادهای محصول'
\ No newline at end of file
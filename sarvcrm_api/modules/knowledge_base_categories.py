@@ -2,6 +2,7 @@ from ._base import SarvModule
 from ._mixins import UrlMixins
 
 class KnowledgeBaseCategories(SarvModule, UrlMixins.DetailView, UrlMixins.ListView, UrlMixins.EditView):
+    __slots__ = ()
     _module_name = 'Knowledge_Base_Categories'
     _label_en = 'Knowledge Base Categories'
     _label_pr = 'دسته پایگاه دانش'
\ No newline at end of file
@@ -2,6 +2,7 @@ from ._base import SarvModule
 from ._mixins import UrlMixins
 
 class ObjObjectives(SarvModule, UrlMixins.DetailView, UrlMixins.ListView, UrlMixins.EditView):
+    __slots__ = ()
     _module_name = 'OBJ_Objectives'
     _label_en = 'Objectives'
     _label_pr = 'اهداف'
\ No newline at end of file
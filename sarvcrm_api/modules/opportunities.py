@@ -2,6 +2,7 @@ from ._base import SarvModule
 from ._mixins import UrlMixins
 
 class Opportunities(SarvModule, UrlMixins.DetailView, UrlMixins.ListView, UrlMixins.EditView):
+    __slots__ = ()
     _module_name = 'Opportunities'
     _label_en = 'Opportunities'
     _label_pr = 'فرصت ها'
\ No newline at end of file
@@ -2,6 +2,7 @@ from ._base import SarvModule
 from ._mixins import UrlMixins
 
 class ScContractManagement(SarvModule, UrlMixins.DetailView, UrlMixins.ListView, UrlMixins.EditView):
+    __slots__ = ()
     _module_name = 'sc_contract_management'
     _label_en = 'Services'
     _label_pr = 'خدمات'
\ No newline at end of file
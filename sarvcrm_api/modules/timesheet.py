@@ -2,6 +2,7 @@ from ._base import SarvModule
 from ._mixins import UrlMixins
 
 class Timesheet(SarvModule, UrlMixins.DetailView, UrlMixins.ListView, UrlMixins.EditView):
+    __slots__ = ()
     _module_name = 'Timesheet'
     _label_en = 'Timesheet'
     _label_pr = 'تایم شیت'
\ No newline at end of file
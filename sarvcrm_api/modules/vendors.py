@@ -2,6 +2,7 @@ from ._base import SarvModule
 from ._mixins import UrlMixins
 
 class Vendors(SarvModule, UrlMixins.DetailView, UrlMixins.ListView, UrlMixins.EditView):
+    __slots__ = ()
     _module_name = 'Vendors'
     _label_en = 'Vendors'
     _label_pr = 'تامین کنندگان'
\ No newline at end of file
@@ -1,6 +1,9 @@
-import json, hashlib
-from requests import Response, request
-from typing import Optional, Self
+import hashlib, time
+from copy import deepcopy
+from requests import Response, Session
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Any, Iterator, Optional, Self, get_args
 from datetime import datetime, timedelta, timezone
 
 from ._url import SarvFrontend, SarvURL
@@ -11,6 +14,17 @@ from .type_hints import TimeOutput, SarvLanguageType, RequestMethod, SarvGetMeth
 
 from .modules._base import SarvModule
 
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
+
+REQUEST_METHODS = frozenset(get_args(RequestMethod))
+CACHE_MAX_SIZE = 256
+# Returned by the cache lookup on a miss, cached data itself may be None
+CACHE_MISS = object()
+# Sarv methods that change server data and invalidate cached responses
+CACHE_INVALIDATING_METHODS = frozenset({'Login', 'Save', 'SaveRelationships'})
 
 class SarvClient(ModulesMixin):
     """
@@ -18,6 +32,22 @@ class SarvClient(ModulesMixin):
     It supports authentication, data retrieval, and other API functionalities.
     """
 
+    # Modules are cached in the instance __dict__ provided by ModulesMixin
+    __slots__ = (
+        'utype',
+        'username',
+        'login_type',
+        'language',
+        'api_url',
+        'frontend_url',
+        'password',
+        'cache_ttl',
+        '_cache',
+        '_base_headers',
+        '_token',
+        '_session',
+    )
+
     def __init__(
             self,
             utype: str,
@@ -28,6 +58,7 @@ class SarvClient(ModulesMixin):
             login_type: Optional[str] = None, 
             language: SarvLanguageType = 'en_US',
             is_password_md5: bool = False,
+            cache_ttl: float = 60,
             ) -> None:
         """
         Initialize the SarvClient.
@@ -41,6 +72,7 @@ class SarvClient(ModulesMixin):
             login_type (Optional[str]): The login type for authentication.
             language (SarvLanguageType): The language to use, default is 'en_US'.
             is_password_md5 (bool): Whether the password is already hashed using MD5.
+            cache_ttl (float): Seconds that GET responses are served from cache, 0 disables caching.
         """
 
         self.utype = utype
@@ -50,12 +82,35 @@ class SarvClient(ModulesMixin):
         self.api_url = api_url
         self.frontend_url = frontend_url
 
-        if is_password_md5 == True:
+        # MD5 is required by the login protocol, it is not used as a security primitive
+        if is_password_md5:
             self.password = password
         else:
-            self.password = hashlib.md5(password.encode('utf-8')).hexdigest()
-
-        self.token: str = ''
+            self.password = hashlib.new('md5', password.encode('utf-8'), usedforsecurity=False).hexdigest()
+
+        # GET responses by their parameters: (fetch time, data, etag)
+        self.cache_ttl = cache_ttl
+        self._cache: dict[frozenset, tuple[float, Any, Optional[str]]] = {}
+
+        # Default headers, Authorization is kept in sync by the token property
+        self._base_headers: dict[str, str] = {'Content-Type': 'application/json'}
+        self._token: str = ''
+
+        # Keep-alive connections are reused across requests to the same server,
+        # responses are compressed with brotli or gzip (Accept-Encoding is set by requests)
+        self._session = Session()
+        # Idempotent requests are retried with backoff on connection errors and temporary server errors,
+        # the last response is still returned so raise_for_status reports it
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset({'GET', 'PUT', 'DELETE'}),
+            raise_on_status=False,
+            )
+        adapter = HTTPAdapter(max_retries=retry, pool_connections=10, pool_maxsize=20)
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
 
         super().__init__()
 
@@ -77,33 +132,34 @@ class SarvClient(ModulesMixin):
         Returns:
             dict: The constructed GET parameters.
         """
-        module_name = None
+        get_parms = {}
+        if sarv_get_method is not None: get_parms['method'] = sarv_get_method
 
         if sarv_module is not None:
-            if isinstance(sarv_module, SarvModule):
-                module_name = sarv_module._module_name
-            elif isinstance(sarv_module, str):
-                module_name = sarv_module
+            if type(sarv_module) is str:
+                get_parms['module'] = sarv_module
             else:
-                raise TypeError(f'Module type must be instance of SarvModule or str not {sarv_module.__class__.__name__}')
-        
-        get_parms = {
-            'method': sarv_get_method,
-            'module': module_name,
-        }
-        get_parms = {k: v for k, v in get_parms.items() if v is not None}
+                try:
+                    get_parms['module'] = sarv_module._module_name
+                except AttributeError:
+                    # Rare path, subclasses of str or an invalid type
+                    if not isinstance(sarv_module, str):
+                        raise TypeError(f'Module type must be instance of SarvModule or str not {sarv_module.__class__.__name__}') from None
+                    get_parms['module'] = sarv_module
 
         if addition:
-            get_parms.update(**addition)
+            get_parms.update(addition)
 
         return get_parms
 
 
+    @staticmethod
     def iso_time_output(output_method: TimeOutput, dt: datetime | timedelta) -> str:
         """
         Generate a formatted string from a datetime or timedelta object.
 
         These formats are compliant with the SarvCRM API time standards.
+        The local timezone is resolved per call, so the offset follows daylight saving changes.
 
         Args:
             output_method (TimeOutput): Determines the output format ('date', 'datetime', or 'time').
@@ -154,17 +210,13 @@ class SarvClient(ModulesMixin):
             SarvException: If the server returns an error response.
         """
 
-        head_parms = head_parms or {}
-        get_parms = get_parms or {}
-        post_parms = post_parms or {}
+        head_parms, get_parms, post_parms = self._prepare_request(request_method, head_parms, get_parms, post_parms)
 
-        # Default Header
-        head_parms['Content-Type'] = 'application/json'
+        cache_key, cached_data, stale_entry, head_parms = self._cache_lookup(request_method, head_parms, get_parms)
+        if cached_data is not CACHE_MISS:
+            return cached_data
 
-        if self.token:
-            head_parms['Authorization'] = f'Bearer {self.token}'
-
-        response:Response = request(
+        response:Response = self._session.request(
             method=request_method,
             url = self.api_url,
             params = get_parms,
@@ -173,45 +225,263 @@ class SarvClient(ModulesMixin):
             verify = True,
             )
 
-        # Check for Server respond
-        if 200 <= response.status_code < 500:
-            try:
-                # Deserialize sarvcrm servers response
-                response_dict: dict = json.loads(response.text)
+        return self._handle_response(response, cache_key, stale_entry)
+
+
+    def send_request_stream(
+            self,
+            request_method: RequestMethod,
+            head_parms: Optional[dict] = None,
+            get_parms: Optional[dict] = None,
+            post_parms: Optional[dict] = None,
+            ) -> Iterator[dict]:
+        """
+        Send a request to the Sarv API and yield the items of the response data one at a time.
+
+        The response body is parsed while it is downloaded, so only one item is kept in memory.
+        Requires the optional `ijson` package.
+
+        Args:
+            request_method (RequestMethod): The HTTP method for the request ('GET', 'POST', etc.).
+            head_parms (dict): The headers for the request.
+            get_parms (dict): The GET parameters for the request.
+            post_parms (dict): The POST parameters for the request.
+
+        Yields:
+            dict: Each item of the data parameter from the server response.
+
+        Raises:
+            SarvException: If the server returns an error response.
+            ImportError: If `ijson` is not installed.
+        """
+        # Optional dependency, imported here to keep the package import fast
+        try:
+            import ijson
+        except ImportError:
+            raise ImportError('Streaming requires the ijson package, install it with: pip install py-sarvcrm-api[ijson]') from None
+
+        head_parms, get_parms, post_parms = self._prepare_request(request_method, head_parms, get_parms, post_parms)
+
+        with self._session.request(
+            method=request_method,
+            url = self.api_url,
+            params = get_parms,
+            headers = head_parms,
+            json = post_parms,
+            verify = True,
+            stream = True,
+            ) as response:
 
-            # Checking for invalid response
-            except json.decoder.JSONDecodeError:
-                if 'MySQL Error' in response.text:
-                    response_dict: dict = {
-                        'message': 'There are Errors in the database\nif you are sending raw SQL Query to server please check syntax and varibles'
-                    }
+            # Error responses are small, handle them as usual
+            if not 200 <= response.status_code < 300:
+                self._handle_response(response)
+                return
 
-                else:
-                    response_dict: dict = {'message': 'Unkhown error'}
+            # Let urllib3 decompress the raw stream
+            response.raw.decode_content = True
+            try:
+                yield from ijson.items(response.raw, 'data.item', use_float=True)
 
-            except Exception as e:
+            except ijson.JSONError as e:
                 raise SarvException(
                     f'There is problem while converting response to json: {e}'
                     )
 
-        else:
-            # Raise on server side http error
-            response.raise_for_status()
 
-        # Initiate server response
-        if 200 <= response.status_code < 300:
-            data = response_dict.get('data', {})
+    def _prepare_request(
+            self,
+            request_method: RequestMethod,
+            head_parms: Optional[dict] = None,
+            get_parms: Optional[dict] = None,
+            post_parms: Optional[dict] = None,
+            ) -> tuple[dict, dict, dict]:
+        """
+        Validate the HTTP method and fill in the default headers and empty parameters for a request.
+
+        Args:
+            request_method (RequestMethod): The HTTP method for the request ('GET', 'POST', etc.).
+            head_parms (dict): The headers for the request.
+            get_parms (dict): The GET parameters for the request.
+            post_parms (dict): The POST parameters for the request.
+
+        Returns:
+            tuple: The headers, GET parameters and POST parameters.
+
+        Raises:
+            TypeError: If the HTTP method is not supported.
+        """
+        if request_method not in REQUEST_METHODS:
+            raise TypeError(f'Invalid HTTP method: {request_method}')
+
+        # Default headers are shared between requests and must not be mutated
+        head_parms = {**self._base_headers, **head_parms} if head_parms else self._base_headers
+        get_parms = get_parms or {}
+        post_parms = post_parms or {}
+
+        return head_parms, get_parms, post_parms
+
+
+    def _cache_lookup(
+            self,
+            request_method: RequestMethod,
+            head_parms: dict,
+            get_parms: dict,
+            ) -> tuple[Optional[frozenset], Any, Optional[tuple], dict]:
+        """
+        Look up the cached response of a request.
+
+        Requests that change server data clear the cache, requests with custom headers
+        are not cached. When a stale response
+        has an ETag, the `If-None-Match` header is added to a copy of the request headers
+        and the stale entry is returned, to be served if the server answers 304.
+
+        Args:
+            request_method (RequestMethod): The HTTP method for the request.
+            head_parms (dict): The headers for the request.
+            get_parms (dict): The GET parameters for the request.
+
+        Returns:
+            tuple: The cache key (None if the request is not cacheable), the cached data (CACHE_MISS on a miss),
+                the stale entry being revalidated (or None) and the request headers.
+        """
+        if request_method != 'GET':
+            if request_method != 'POST' or get_parms.get('method') in CACHE_INVALIDATING_METHODS:
+                self.clear_cache()
+            return None, CACHE_MISS, None, head_parms
+
+        # Custom headers (eg. Accept-Language) may change the response, so only default requests are cached.
+        # _prepare_request passes the shared default headers through unless the caller supplied some.
+        if self.cache_ttl <= 0 or head_parms is not self._base_headers:
+            return None, CACHE_MISS, None, head_parms
+
+        try:
+            cache_key = frozenset(get_parms.items())
+        except TypeError:
+            # Unhashable values (eg. lists sent as repeated query parameters) are not cached
+            return None, CACHE_MISS, None, head_parms
+
+        entry = self._cache.get(cache_key)
+        if entry is None:
+            return cache_key, CACHE_MISS, None, head_parms
+
+        fetched_at, data, etag = entry
+        if time.monotonic() - fetched_at < self.cache_ttl:
+            # Mark as recently used
+            self._cache[cache_key] = self._cache.pop(cache_key, entry)
+            return cache_key, deepcopy(data), None, head_parms
+
+        if etag:
+            return cache_key, CACHE_MISS, entry, {**head_parms, 'If-None-Match': etag}
+
+        return cache_key, CACHE_MISS, None, head_parms
+
+
+    def _cache_store(self, cache_key: frozenset, data: Any, etag: Optional[str]) -> None:
+        """
+        Store the data of a GET response, dropping the least recently used entry when full.
+
+        Args:
+            cache_key (frozenset): The cache key of the request.
+            data (Any): The data parameter from the server response.
+            etag (Optional[str]): The ETag header of the server response.
+        """
+        self._cache.pop(cache_key, None)
+        self._cache[cache_key] = (time.monotonic(), deepcopy(data), etag)
+
+        if len(self._cache) > CACHE_MAX_SIZE:
+            # The cache may be cleared by another thread meanwhile
+            oldest_key = next(iter(self._cache), None)
+            if oldest_key is not None:
+                self._cache.pop(oldest_key, None)
+
+
+    def clear_cache(self) -> None:
+        """
+        Remove all cached GET responses.
+        """
+        self._cache.clear()
+
+
+    def _handle_response(
+            self,
+            response: Response,
+            cache_key: Optional[frozenset] = None,
+            stale_entry: Optional[tuple] = None,
+            ) -> dict:
+        """
+        Check the server response and extract its data.
+
+        Works with both `requests` and `httpx` responses.
+
+        Args:
+            response (Response): The response returned by the server.
+            cache_key (Optional[frozenset]): The cache key of a cacheable GET request.
+            stale_entry (Optional[tuple]): The cached entry being revalidated with its ETag.
+
+        Returns:
+            dict: The data parameter from the server response.
+
+        Raises:
+            SarvException: If the server returns an error response.
+        """
+        status_code = response.status_code
+
+        # Successful responses are the common case
+        if 200 <= status_code < 300:
+            data = self._parse_response(response).get('data', {})
+            if cache_key is not None:
+                self._cache_store(cache_key, data, response.headers.get('ETag'))
             return data
 
-        elif 300 <= response.status_code < 400:
-            raise SarvException(
-                f"Redirection Response: {response.status_code} - {response_dict.get('message', 'Unknown error')}"
-            )
+        # Cached response is still valid
+        if status_code == 304 and stale_entry is not None:
+            _, data, etag = stale_entry
+            self._cache_store(cache_key, data, etag)
+            return deepcopy(data)
 
-        else:
+        # Raise on server side http error, without parsing the body
+        if status_code >= 500:
+            response.raise_for_status()
+
+        message = self._parse_response(response).get('message', 'Unknown error')
+
+        if 300 <= status_code < 400:
+            raise SarvException(f"Redirection Response: {status_code} - {message}")
+
+        raise SarvException(f"{status_code} - {message}")
+
+
+    @staticmethod
+    def _parse_response(response: Response) -> dict:
+        """
+        Deserialize the body of a server response.
+
+        Args:
+            response (Response): The response returned by the server.
+
+        Returns:
+            dict: The server response, or a dict with an error message if the body is not valid json.
+
+        Raises:
+            SarvException: If the body can not be converted.
+        """
+        try:
+            # Deserialize sarvcrm servers response, straight from the raw bytes
+            return _loads(response.content) if response.content else {}
+
+        # Checking for invalid response
+        except ValueError:
+            if b'MySQL Error' in response.content:
+                return {
+                    'message': 'There are Errors in the database\nif you are sending raw SQL Query to server please check syntax and varibles'
+                }
+
+            return {'message': 'Unkhown error'}
+
+        except Exception as e:
             raise SarvException(
-                f"{response.status_code} - {response_dict.get('message', 'Unknown error')}"
-            )
+                f'There is problem while converting response to json: {e}'
+                )
 
 
     def login(self) -> str:
@@ -221,19 +491,10 @@ class SarvClient(ModulesMixin):
         Returns:
             str: The access token for authenticated requests.
         """
-        post_parms = {
-            'utype': self.utype,
-            'user_name': self.username,
-            'password': self.password,
-            'login_type': self.login_type,
-            'language': self.language,
-            }
-        post_parms = {k: v for k, v in post_parms.items() if v is not None}
-
         data = self.send_request(
             request_method='POST',
             get_parms=self.create_get_parms('Login'), 
-            post_parms=post_parms,
+            post_parms=self._create_login_parms(),
             )
 
         if data:
@@ -242,6 +503,45 @@ class SarvClient(ModulesMixin):
         return self.token
 
 
+    def _create_login_parms(self) -> dict:
+        """
+        Create the POST parameters used for authentication.
+
+        Returns:
+            dict: The login credentials of the instance.
+        """
+        post_parms = {}
+        if self.utype is not None: post_parms['utype'] = self.utype
+        if self.username is not None: post_parms['user_name'] = self.username
+        if self.password is not None: post_parms['password'] = self.password
+        if self.login_type is not None: post_parms['login_type'] = self.login_type
+        if self.language is not None: post_parms['language'] = self.language
+        return post_parms
+
+
+    @property
+    def token(self) -> str:
+        """
+        The access token of the instance.
+
+        Setting it updates the Authorization header of the requests and,
+        when the value changes, clears the responses cached with the previous credentials.
+        """
+        return self._token
+
+
+    @token.setter
+    def token(self, token: str) -> None:
+        if token != self._token:
+            self.clear_cache()
+
+        self._token = token
+        if token:
+            self._base_headers['Authorization'] = f'Bearer {token}'
+        else:
+            self._base_headers.pop('Authorization', None)
+
+
     def logout(self) -> None:
         """
         Clears the access token from the instance.
@@ -251,6 +551,8 @@ class SarvClient(ModulesMixin):
         if self.token:
             self.token = ''
 
+        self.clear_cache()
+
 
     def search_by_number(
             self,
@@ -289,6 +591,15 @@ class SarvClient(ModulesMixin):
         return f'{self.frontend_url}?utype={self.utype}&module=Customer_Console&callerid={number}'
         
 
+    def close(self) -> None:
+        """
+        Close the pooled connections of the http session.
+
+        The session opens new connections if the instance is used again.
+        """
+        self._session.close()
+
+
     def __enter__(self) -> Self:
         """Basic Context Manager for clean code execution"""
         self.login()
@@ -298,6 +609,7 @@ class SarvClient(ModulesMixin):
     def __exit__(self, exc_type, exc_value, traceback):
         """Basic Context Manager for clean code execution"""
         self.logout()
+        self.close()
 
 
     def __repr__(self):